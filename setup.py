@@ -0,0 +1,14 @@
+import os
+
+from setuptools import setup
+
+# Opt-in AOT build: MEMBERSHIP_USE_MYPYC=1 pip install --no-build-isolation .
+# (requires mypy in the build environment). Without it, the package installs
+# as plain Python.
+ext_modules = []
+if os.environ.get("MEMBERSHIP_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/subscription_entitlements_engine/membership.py"])
+
+setup(ext_modules=ext_modules)
@@ -1,7 +1,20 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import asyncio
+import calendar
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Protocol, Any
+from enum import IntEnum
+import sys
+import threading
+import time
+from typing import Callable, Deque, Dict, Final, List, NamedTuple, Optional, Protocol, Tuple, Any
+
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # only meaningful to the optional mypyc build (see setup.py)
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[Any], Any]:  # type: ignore[misc]
+        return lambda cls: cls
 
 
 
@@ -23,6 +36,15 @@ class UnknownTierError(MembershipError):
     """Raised when a tier is invalid or unsupported."""
 
 
+_MSG_INACTIVE: Final = "Member is not active. Cannot access perks."
+_MSG_NO_PERKS: Final = "No perks available to use."
+
+# Denial results of Membership._take_perks (successful takes are >= 1)
+_DENIED_INACTIVE: Final = -1
+_DENIED_NO_PERKS: Final = -2
+_DENIED_USED_FULL: Final = -3
+
+
 # ----------------------------
 # Time abstraction (testability)
 # ----------------------------
@@ -32,10 +54,63 @@ class Clock(Protocol):
         ...
 
 
+class MonthClock(Clock, Protocol):
+    """A clock that can also report the current month_ordinal directly."""
+
+    def now_month_ord(self) -> int:
+        ...
+
+
+# A DST shift can make real time reach the month end up to an hour sooner
+# than wall-clock arithmetic says, so the month cache expires that much early
+_DST_SLACK_S: Final = 3600
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class SystemClock:
+    # (valid_from, valid_until, month_ord) in time.time() seconds, kept in one
+    # tuple so concurrent readers never see a half-updated cache
+    __slots__ = ("_month",)
+
+    def __init__(self) -> None:
+        self._month: Tuple[float, float, int] = (0.0, 0.0, 0)  # empty: first call fills it
+
     def now(self) -> datetime:
         return datetime.now()
 
+    def now_month_ord(self) -> int:
+        # The cache window is measured in real time.time(), which only tracks
+        # now() while it is the original datetime.now(): not when a subclass
+        # overrides it or it is patched on the class or via this module's
+        # datetime (mock.patch, freezegun)
+        if type(self).now is not _SYSTEM_CLOCK_NOW or datetime is not _REAL_DATETIME:
+            return month_ordinal(self.now())
+
+        # Hot path is one time.time() call; now() is only consulted again once
+        # time leaves the cached window, so the result always agrees with now()
+        t = time.time()
+        valid_from, valid_until, month_ord = self._month
+        if valid_from <= t < valid_until:
+            return month_ord
+
+        now = self.now()
+        month_ord = month_ordinal(now)
+        next_year, next_month = divmod(month_ord + 1, 12)
+        left = (
+            calendar.timegm((next_year, next_month + 1, 1, 0, 0, 0))
+            - calendar.timegm(now.timetuple())
+        )
+        self._month = (t, t + left - _DST_SLACK_S, month_ord)
+        return month_ord
+
+
+# Originals captured at import, so SystemClock can tell when now() is patched
+_SYSTEM_CLOCK_NOW: Final = SystemClock.now
+_REAL_DATETIME: Final = datetime
+
+# Default for members created without a clock; sharing it shares the month cache
+_SYSTEM_CLOCK: Final = SystemClock()
+
 
 # ----------------------------
 # External dependencies (mockable)
@@ -46,8 +121,67 @@ class BillingProvider(Protocol):
         ...
 
 
+class AsyncBillingProvider(Protocol):
+    async def get_member_tier(self, member_id: str) -> str:
+        ...
+
+
+class CachingBillingProvider:
+    """
+    LRU + TTL cache in front of a BillingProvider, so repeated syncs only
+    re-query members whose cached tier has expired. Safe to share across
+    the threads used by MembershipService.sync_all.
+    """
+
+    __slots__ = ("_inner", "_ttl_s", "_maxsize", "_timer", "_entries", "_lock")
+
+    def __init__(
+        self,
+        inner: BillingProvider,
+        ttl_s: float = 60.0,
+        maxsize: int = 100_000,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._inner = inner
+        self._ttl_s = ttl_s
+        self._maxsize = maxsize
+        self._timer = timer
+        # member_id -> (tier, expires_at), least recently used first
+        self._entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_member_tier(self, member_id: str) -> str:
+        now = self._timer()
+        with self._lock:
+            hit = self._entries.get(member_id)
+            if hit is not None and hit[1] > now:
+                self._entries.move_to_end(member_id)
+                return hit[0]
+
+        # Query outside the lock so slow lookups don't serialize other threads
+        tier = self._inner.get_member_tier(member_id)
+
+        with self._lock:
+            self._entries[member_id] = (tier, now + self._ttl_s)
+            self._entries.move_to_end(member_id)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return tier
+
+    def invalidate(self, member_id: Optional[str] = None) -> None:
+        """Drop one member's cached tier, or everything when member_id is None."""
+        with self._lock:
+            if member_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(member_id, None)
+
+
 class Notifier(Protocol):
-    def send(self, to_member_id: str, subject: str, body: str) -> None:
+    # Return value is ignored; typed as object so compiled builds accept any
+    def send(self, to_member_id: str, subject: str, body: str) -> object:
         ...
 
 
@@ -55,25 +189,92 @@ class Notifier(Protocol):
 # Tier policy (data-driven rules)
 # ----------------------------
 
-@dataclass(frozen=True)
-class TierPolicy:
+class TierPolicy(NamedTuple):
     monthly_perks: int
     rollover_unused: bool = False
     rollover_cap: Optional[int] = None  # e.g., cap total perks at 8 for Gold
 
 
 TIER_POLICIES: Dict[str, TierPolicy] = {
-    "Bronze": TierPolicy(monthly_perks=1, rollover_unused=False),
-    "Silver": TierPolicy(monthly_perks=2, rollover_unused=False),
-    "Gold":   TierPolicy(monthly_perks=4, rollover_unused=True, rollover_cap=8),
+    sys.intern(name): policy
+    for name, policy in {
+        "Bronze": TierPolicy(monthly_perks=1, rollover_unused=False),
+        "Silver": TierPolicy(monthly_perks=2, rollover_unused=False),
+        "Gold":   TierPolicy(monthly_perks=4, rollover_unused=True, rollover_cap=8),
+    }.items()
 }
 
+# Fallback for tiers missing from TIER_POLICIES (shared, never mutated)
+_ZERO_POLICY: Final = TierPolicy(monthly_perks=0, rollover_unused=False)
+
+
+class Tier(IntEnum):
+    """Compact tier id; names stay on the public API, ids index policy tables."""
+    BRONZE = 0
+    SILVER = 1
+    GOLD = 2
+    UNKNOWN = 3
+
+
+_TIER_IDS: Dict[str, Tier] = {
+    "Bronze": Tier.BRONZE,
+    "Silver": Tier.SILVER,
+    "Gold": Tier.GOLD,
+}
+
+# Indexed by Tier; the last row serves every unknown tier
+_POLICY_BY_ID: Final = tuple(TIER_POLICIES[name] for name in _TIER_IDS) + (_ZERO_POLICY,)
+
+
+# perks_available and perks_used share one int: (available << 16) | used.
+# Each field must stay within 0.._PERK_MASK or it carries into the other.
+_PERK_BITS: Final = 16
+_PERK_MASK: Final = 0xFFFF
+
+
+def _pack_perks(available: int, used: int) -> int:
+    if not (0 <= available <= _PERK_MASK and 0 <= used <= _PERK_MASK):
+        raise ValueError(f"perk counts must be between 0 and {_PERK_MASK}")
+    return (available << _PERK_BITS) | used
+
+
+def _make_refresh(policy: TierPolicy) -> Callable[[int], int]:
+    """
+    Specialize the month-refresh rule for one tier: packed perk state at the
+    end of a month -> packed state for the new month (perks_used reset to 0).
+    perks_available never exceeds _PERK_MASK, even for uncapped rollover.
+    """
+    base = policy.monthly_perks
+    limit = _PERK_MASK if policy.rollover_cap is None else min(policy.rollover_cap, _PERK_MASK)
+    if not policy.rollover_unused:
+        # No rollover: every member of the tier starts the month the same way
+        fixed = min(base, limit) << _PERK_BITS
+        return lambda state: fixed
+    return lambda state: min(base + (state >> _PERK_BITS), limit) << _PERK_BITS
+
+
+# Indexed by Tier, parallel to _POLICY_BY_ID
+_REFRESH_BY_ID: Final = tuple(_make_refresh(policy) for policy in _POLICY_BY_ID)
+
+
+class AuditEntry(NamedTuple):
+    timestamp: datetime
+    action: str
+    member_id: str
+    tier: str
+    details: Optional[Dict[str, Any]] = None
+
 
 def month_key(dt: datetime) -> str:
-    """Used to detect month transitions (YYYY-MM)."""
+    """Human-readable month label (YYYY-MM); kept for callers and debugging."""
     return f"{dt.year:04d}-{dt.month:02d}"
 
 
+def month_ordinal(dt: datetime) -> int:
+    """Months since year 0 (year * 12 + month - 1); cheap to compare."""
+    return dt.year * 12 + dt.month - 1
+
+
 # ----------------------------
 # Core domain model
 # ----------------------------
@@ -84,97 +285,192 @@ class Membership:
     - tier-based monthly perks
     - optional rollover (Gold rolls unused perks, capped)
     - automatic monthly refresh based on clock
-    - audit trail for actions (operational thinking)
+    - audit trail for actions (operational thinking); pass audit=False to
+      disable it or audit_maxlen to keep only the most recent entries
     """
 
+    __slots__ = (
+        "member_id",
+        "tier",
+        "is_active",
+        "clock",
+        "_state",
+        "audit_log",
+        "_current_month_ord",
+        "_now_month_ord",
+        "_tier_id",
+        "_refresh_fn",
+    )
+
     def __init__(
         self,
         member_id: str,
         tier: str,
         is_active: bool = True,
         clock: Optional[Clock] = None,
+        audit: bool = True,
+        audit_maxlen: Optional[int] = None,
     ):
         self.member_id = member_id
-        self.tier = tier
+        self.tier: str = ""
+        self._tier_id: Tier = Tier.UNKNOWN
+        self._refresh_fn: Callable[[int], int] = _REFRESH_BY_ID[Tier.UNKNOWN]
+        self._assign_tier(tier)
         self.is_active = is_active
-        self.clock: Clock = clock or SystemClock()
+        self.clock: Clock = clock or _SYSTEM_CLOCK
+        # Clocks whose class implements MonthClock skip the datetime on refresh
+        # checks. Looked up on the type so duck-typed clocks with dynamic
+        # attributes (e.g. Mock) keep going through now().
+        self._now_month_ord: Optional[Callable[[], int]] = (
+            getattr(self.clock, "now_month_ord")
+            if hasattr(type(self.clock), "now_month_ord")
+            else None
+        )
 
-        self.perks_available: int = 0
-        self.perks_used: int = 0
-        self.audit_log: List[Dict[str, Any]] = []
+        self._state: int = 0  # packed perks; see perks_available / perks_used
+        self.audit_log: Optional[Deque[AuditEntry]] = (
+            deque(maxlen=audit_maxlen) if audit else None
+        )
 
-        # Track month to enable auto-refresh
-        self._current_month_key: str = month_key(self.clock.now())
+        # Track month (see month_ordinal) to enable auto-refresh
+        self._current_month_ord: int = self._month_ord()
 
         # Initialize perks for current month
         self._initialize_month()
 
+    @property
+    def perks_available(self) -> int:
+        return self._state >> _PERK_BITS
+
+    @perks_available.setter
+    def perks_available(self, value: int) -> None:
+        self._state = _pack_perks(value, self._state & _PERK_MASK)
+
+    @property
+    def perks_used(self) -> int:
+        return self._state & _PERK_MASK
+
+    @perks_used.setter
+    def perks_used(self, value: int) -> None:
+        self._state = _pack_perks(self._state >> _PERK_BITS, value)
+
+    def _assign_tier(self, tier: str) -> None:
+        # Interned so comparisons against the known tier names are pointer checks
+        self.tier = sys.intern(tier)
+        self._tier_id = _TIER_IDS.get(self.tier, Tier.UNKNOWN)
+        # Shared per-tier function, picked once here instead of on every refresh
+        self._refresh_fn = _REFRESH_BY_ID[self._tier_id]
+
     def _policy(self) -> TierPolicy:
-        if self.tier not in TIER_POLICIES:
-            return TierPolicy(monthly_perks=0, rollover_unused=False)
-        return TIER_POLICIES[self.tier]
+        return _POLICY_BY_ID[self._tier_id]
 
     def _log(self, action: str, details: Optional[Dict[str, Any]] = None) -> None:
-        entry = {
-            "timestamp": self.clock.now(),
-            "action": action,
-            "member_id": self.member_id,
-            "tier": self.tier,
-        }
-        if details:
-            entry.update(details)
-        self.audit_log.append(entry)
+        if self.audit_log is None:
+            return
+        self.audit_log.append(
+            AuditEntry(self.clock.now(), action, self.member_id, self.tier, details)
+        )
 
     def _initialize_month(self) -> None:
         """Set perks for the current month on first creation."""
-        policy = self._policy()
-        self.perks_available = policy.monthly_perks
-        self.perks_used = 0
-        self._log("init_month", {"perks_available": self.perks_available})
+        available = self._policy().monthly_perks
+        self._state = _pack_perks(available, 0)
+        self._log("init_month", {"perks_available": available})
+
+    def _month_ord(self) -> int:
+        if self._now_month_ord is not None:
+            return self._now_month_ord()
+        return month_ordinal(self.clock.now())
 
     def _refresh_if_needed(self) -> None:
         """Automatically refresh perks if we crossed into a new month."""
-        now = self.clock.now()
-        key = month_key(now)
-        if key != self._current_month_key:
+        month_ord = self._month_ord()
+        if month_ord != self._current_month_ord:
             self._refresh_for_new_month()
-            self._current_month_key = key
+            self._current_month_ord = month_ord
+
+    def roll_to_month(self, month_ord: int) -> bool:
+        """
+        Refresh into month_ord (see month_ordinal) ahead of the member's next
+        action. Only happens when the member's own clock is already in that
+        month; rolling earlier would make the next action refresh again.
+        Returns True if the member was refreshed.
+        """
+        if month_ord == self._current_month_ord or self._month_ord() != month_ord:
+            return False
+        self._refresh_for_new_month()
+        self._current_month_ord = month_ord
+        return True
 
     def _refresh_for_new_month(self) -> None:
         """Refresh perks at month boundary, applying rollover rules."""
-        policy = self._policy()
-
-        unused = self.perks_available  # perks remaining at end of month
-        base = policy.monthly_perks
-        rollover_add = unused if policy.rollover_unused else 0
-
-        new_total = base + rollover_add
-
-        if policy.rollover_cap is not None:
-            new_total = min(new_total, policy.rollover_cap)
+        state = self._state
+        self._state = self._refresh_fn(state)
+
+        if self.audit_log is not None:
+            self._log(
+                "month_refresh",
+                {
+                    "unused_prev_month": state >> _PERK_BITS,  # perks remaining at end of month
+                    "new_perks_available": self._state >> _PERK_BITS,
+                },
+            )
 
-        self.perks_available = new_total
-        self.perks_used = 0
+    def use_perk(self) -> None:
+        self.use_perks(1)
 
-        self._log(
-            "month_refresh",
-            {"unused_prev_month": unused, "new_perks_available": self.perks_available},
-        )
+    def use_perks(self, n: int) -> int:
+        """
+        Use up to n perks in one step (one refresh check, one audit entry).
+        Returns how many were actually used, which is less than n when
+        fewer perks are available.
+        """
+        if n < 1:
+            raise ValueError("n must be at least 1")
+
+        taken = self._take_perks(n)
+        if taken > 0:
+            return taken
+        if taken == _DENIED_INACTIVE:
+            raise InactiveMemberError(_MSG_INACTIVE)
+        if taken == _DENIED_NO_PERKS:
+            raise NoPerksAvailableError(_MSG_NO_PERKS)
+        raise ValueError(f"perks_used cannot exceed {_PERK_MASK}")
+
+    def try_use_perk(self) -> bool:
+        """
+        Like use_perk, but returns False instead of raising when the perk
+        can't be used (cheaper for availability probes).
+        """
+        return self._take_perks(1) > 0
 
-    def use_perk(self) -> None:
+    def _take_perks(self, n: int) -> int:
+        """
+        Shared body of use_perks / try_use_perk: refresh, check, then take up
+        to n perks. Returns how many were taken, or a _DENIED_* code.
+        """
         self._refresh_if_needed()
 
         if not self.is_active:
             self._log("use_perk_denied_inactive")
-            raise InactiveMemberError("Member is not active. Cannot access perks.")
+            return _DENIED_INACTIVE
 
-        if self.perks_available <= 0:
+        state = self._state
+        available = state >> _PERK_BITS
+        if available <= 0:
             self._log("use_perk_denied_no_perks")
-            raise NoPerksAvailableError("No perks available to use.")
+            return _DENIED_NO_PERKS
 
-        self.perks_available -= 1
-        self.perks_used += 1
-        self._log("perk_used", {"perks_available": self.perks_available})
+        taken = n if n <= available else available
+        if (state & _PERK_MASK) + taken > _PERK_MASK:
+            # Would carry into the available bits (see _PERK_MASK)
+            self._log("use_perk_denied_used_full")
+            return _DENIED_USED_FULL
+
+        # One store: available -= taken, used += taken
+        self._state = state - (taken << _PERK_BITS) + taken
+        self._log("perk_used", {"n": taken, "perks_available": available - taken})
+        return taken
 
     def set_active(self, active: bool) -> None:
         self.is_active = active
@@ -190,11 +486,12 @@ class Membership:
         self._refresh_if_needed()
 
         old_tier = self.tier
-        self.tier = new_tier
+        self._assign_tier(new_tier)
         policy = self._policy()
 
-        remaining = max(policy.monthly_perks - self.perks_used, 0)
-        self.perks_available = remaining
+        used = self._state & _PERK_MASK
+        remaining = max(policy.monthly_perks - used, 0)
+        self._state = _pack_perks(remaining, used)
 
         self._log("tier_changed", {"old_tier": old_tier, "new_tier": new_tier, "perks_available": remaining})
 
@@ -215,20 +512,80 @@ class Membership:
 class MembershipService:
     """Manages many memberships like a small backend service would."""
 
-    def __init__(self):
+    __slots__ = ("_members",)
+
+    def __init__(self) -> None:
         self._members: Dict[str, Membership] = {}
 
+    def __len__(self) -> int:
+        return len(self._members)
+
     def add_member(self, membership: Membership) -> None:
         self._members[membership.member_id] = membership
 
     def get(self, member_id: str) -> Membership:
-        if member_id not in self._members:
+        # Members are never None, so one .get() replaces `in` + indexing
+        m = self._members.get(member_id)
+        if m is None:
             raise KeyError(f"Member {member_id} not found")
-        return self._members[member_id]
+        return m
 
     def use_perk(self, member_id: str) -> None:
         self.get(member_id).use_perk()
 
-    def sync_all(self, billing: BillingProvider) -> None:
-        for m in self._members.values():
-            m.sync_with_billing(billing)
+    def sync_all(self, billing: BillingProvider, max_workers: Optional[int] = None) -> None:
+        """
+        Sync every member's tier from billing. With max_workers, members are
+        split into that many slices synced concurrently on a thread pool
+        (billing must be thread-safe); each member is only touched by one thread.
+        """
+        if not max_workers:
+            for m in self._members.values():
+                m.sync_with_billing(billing)
+            return
+
+        def sync_slice(members: List[Membership]) -> None:
+            for m in members:
+                m.sync_with_billing(billing)
+
+        members = list(self._members.values())
+        slices = [members[i::max_workers] for i in range(max_workers)]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # list() surfaces the first exception raised by any slice
+            list(pool.map(sync_slice, slices))
+
+    async def sync_all_async(
+        self,
+        billing: AsyncBillingProvider,
+        concurrency: int = 40,
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        Sync every member's tier from an async billing provider with at most
+        `concurrency` lookups in flight. Members are scheduled batch_size at
+        a time so the number of pending coroutines stays bounded.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def sync_one(m: Membership) -> None:
+            async with sem:
+                new_tier = await billing.get_member_tier(m.member_id)
+            m.apply_tier_change(new_tier)
+
+        members = list(self._members.values())
+        for i in range(0, len(members), batch_size):
+            await asyncio.gather(*[sync_one(m) for m in members[i:i + batch_size]])
+
+    def bulk_sync(self, new_month_ord: int) -> int:
+        """
+        Roll members into new_month_ord (see month_ordinal) without waiting
+        for their next action. Only members whose clock is already in that
+        month are refreshed (e.g. a cron job that fires early skips them).
+        Returns how many were refreshed.
+        """
+        return sum(m.roll_to_month(new_month_ord) for m in self._members.values())
@@ -3,6 +3,7 @@ from datetime import datetime
 
 from subscription_entitlements_engine.membership import (
     Membership,
+    SystemClock,
     InactiveMemberError,
     NoPerksAvailableError,
 )
@@ -76,6 +77,106 @@ class TestMembershipCore(unittest.TestCase):
         with self.assertRaises(NoPerksAvailableError):
             unknown.use_perk()
 
+    def test_tier_change_uses_new_tier_policy(self):
+        clock = FakeClock(datetime(2025, 5, 1, 9, 0, 0))
+        member = Membership("010", "Platinum", clock=clock)
+        self.assertEqual(member.perks_available, 0)
+
+        member.apply_tier_change("Silver")
+        self.assertEqual(member.perks_available, 2)
+
+        member.apply_tier_change("Platinum")
+        self.assertEqual(member.perks_available, 0)
+
+    def test_audit_log_can_be_disabled_or_bounded(self):
+        clock = FakeClock(datetime(2025, 5, 1, 9, 0, 0))
+        quiet = Membership("011", "Gold", clock=clock, audit=False)
+        quiet.use_perk()
+        self.assertIsNone(quiet.audit_log)
+        self.assertEqual(quiet.perks_available, 3)
+
+        bounded = Membership("012", "Gold", clock=clock, audit_maxlen=2)
+        bounded.use_perk()
+        bounded.use_perk()
+        self.assertEqual(len(bounded.audit_log), 2)
+
+        last = bounded.audit_log[-1]
+        self.assertEqual(last.action, "perk_used")
+        self.assertEqual(last.details, {"n": 1, "perks_available": 2})
+
+    def test_use_perks_takes_at_most_available(self):
+        clock = FakeClock(datetime(2025, 5, 1, 9, 0, 0))
+        gold = Membership("013", "Gold", clock=clock)  # starts with 4
+
+        self.assertEqual(gold.use_perks(3), 3)
+        self.assertEqual(gold.use_perks(3), 1)
+        self.assertEqual(gold.perks_available, 0)
+        self.assertEqual(gold.perks_used, 4)
+
+        with self.assertRaises(NoPerksAvailableError):
+            gold.use_perks(1)
+
+    def test_month_clock_fast_path_drives_refresh(self):
+        class MonthOnlyClock(FakeClock):
+            def now_month_ord(self) -> int:
+                return self._dt.year * 12 + self._dt.month - 1
+
+        clock = MonthOnlyClock(datetime(2025, 5, 1, 9, 0, 0))
+        gold = Membership("014", "Gold", clock=clock)
+        gold.use_perk()  # 4 -> 3
+
+        clock.set(datetime(2025, 6, 1, 9, 0, 0))
+        gold.use_perk()  # refresh to 7, then use one
+        self.assertEqual(gold.perks_available, 6)
+
+    def test_try_use_perk_returns_false_instead_of_raising(self):
+        clock = FakeClock(datetime(2025, 5, 1, 9, 0, 0))
+        bronze = Membership("015", "Bronze", clock=clock)
+
+        self.assertTrue(bronze.try_use_perk())
+        self.assertFalse(bronze.try_use_perk())
+        self.assertEqual(bronze.perks_used, 1)
+
+        bronze.set_active(False)
+        clock.set(datetime(2025, 6, 1, 9, 0, 0))
+        self.assertFalse(bronze.try_use_perk())
+
+    def test_perk_counts_stay_independent(self):
+        clock = FakeClock(datetime(2025, 5, 1, 9, 0, 0))
+        gold = Membership("016", "Gold", clock=clock)
+        gold.use_perks(3)
+
+        gold.perks_available = 5
+        self.assertEqual((gold.perks_available, gold.perks_used), (5, 3))
+        gold.perks_used = 0
+        self.assertEqual((gold.perks_available, gold.perks_used), (5, 0))
+
+        with self.assertRaises(ValueError):
+            gold.perks_available = -1
+
+        # A full perks_used must not carry into perks_available
+        gold.perks_used = 0xFFFF
+        with self.assertRaises(ValueError):
+            gold.use_perk()
+        self.assertFalse(gold.try_use_perk())
+        self.assertEqual((gold.perks_available, gold.perks_used), (5, 0xFFFF))
+
+    def test_system_clock_subclass_overriding_now_refreshes(self):
+        class SettableClock(SystemClock):
+            __slots__ = ("dt",)
+
+            def now(self) -> datetime:
+                return self.dt
+
+        clock = SettableClock()
+        clock.dt = datetime(2025, 5, 1, 9, 0, 0)
+        bronze = Membership("017", "Bronze", clock=clock)
+        bronze.use_perk()
+
+        clock.dt = datetime(2025, 6, 1, 9, 0, 0)
+        bronze.use_perk()  # refresh to 1, then use it
+        self.assertEqual(bronze.perks_used, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
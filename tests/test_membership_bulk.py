@@ -0,0 +1,69 @@
+import unittest
+from datetime import datetime
+
+from subscription_entitlements_engine.membership import (
+    Membership,
+    MembershipService,
+    month_ordinal,
+)
+
+
+class FakeClock:
+    def __init__(self, dt: datetime):
+        self._dt = dt
+
+    def now(self) -> datetime:
+        return self._dt
+
+    def set(self, dt: datetime) -> None:
+        self._dt = dt
+
+
+class TestBulkRefresh(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(datetime(2025, 5, 1, 9, 0, 0))
+        self.service = MembershipService()
+        for member_id, tier in [("001", "Bronze"), ("002", "Silver"), ("003", "Gold"), ("009", "Platinum")]:
+            self.service.add_member(Membership(member_id, tier, clock=self.clock))
+        self.service.use_perk("002")  # Silver: 2 -> 1
+        self.service.use_perk("003")  # Gold: 4 -> 3
+        self.june = month_ordinal(datetime(2025, 6, 1))
+
+    def test_service_bulk_sync_refreshes_members(self):
+        # Members' clocks are still in May: nothing is rolled early
+        self.assertEqual(self.service.bulk_sync(self.june), 0)
+        self.assertEqual(self.service.get("003").perks_available, 3)
+
+        self.clock.set(datetime(2025, 6, 1, 9, 0, 0))
+        self.assertEqual(self.service.bulk_sync(self.june), 4)
+        self.assertEqual(self.service.get("001").perks_available, 1)
+        self.assertEqual(self.service.get("002").perks_available, 2)
+        self.assertEqual(self.service.get("003").perks_available, 7)
+        self.assertEqual(self.service.get("009").perks_available, 0)
+        self.assertEqual(self.service.bulk_sync(self.june), 0)
+
+        # The next action must not refresh June a second time
+        self.service.use_perk("003")
+        self.assertEqual(self.service.get("003").perks_available, 6)
+
+    def test_roll_to_month_only_follows_members_clock(self):
+        gold = self.service.get("003")
+        self.assertFalse(gold.roll_to_month(self.june))
+
+        self.clock.set(datetime(2025, 6, 1, 9, 0, 0))
+        self.assertTrue(gold.roll_to_month(self.june))
+        self.assertFalse(gold.roll_to_month(self.june))
+        self.assertEqual(gold.perks_available, 7)
+
+    def test_bulk_sync_handles_full_perk_range(self):
+        bronze = self.service.get("001")
+        bronze.perks_available = 40000  # above int16, within the 16-bit unsigned field
+        bronze.perks_used = 0xFFFF
+
+        self.clock.set(datetime(2025, 6, 1, 9, 0, 0))
+        self.assertEqual(self.service.bulk_sync(self.june), 4)
+        self.assertEqual((bronze.perks_available, bronze.perks_used), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
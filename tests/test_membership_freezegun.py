@@ -29,6 +29,17 @@ class TestMembershipWithFreezegun(unittest.TestCase):
             self.assertEqual(silver.perks_available, 1)
             self.assertEqual(silver.perks_used, 1)
 
+    @freeze_time("2025-03-31 12:00:00")
+    def test_refresh_at_exact_month_boundary_freezegun(self):
+        bronze = Membership("008", "Bronze")  # starts 1
+        bronze.use_perk()  # leaves 0
+        self.assertFalse(bronze.try_use_perk())  # still March
+
+        with freeze_time("2025-04-01 00:00:00"):
+            bronze.use_perk()  # first action in April refreshes
+            self.assertEqual(bronze.perks_available, 0)
+            self.assertEqual(bronze.perks_used, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,18 @@
+import asyncio
 import unittest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
 
-from subscription_entitlements_engine.membership import Membership
+from subscription_entitlements_engine import membership
+from subscription_entitlements_engine.membership import (
+    CachingBillingProvider,
+    Membership,
+    MembershipService,
+    SystemClock,
+)
+
+# Compiled (mypyc) classes don't allow patching their attributes
+COMPILED = not membership.__file__.endswith(".py")
 
 
 class FakeClock:
@@ -37,6 +47,93 @@ class TestMembershipWithMocking(unittest.TestCase):
         member.notify(notifier, "Welcome", "You are enrolled.")
         notifier.send.assert_called_once_with("001", "Welcome", "You are enrolled.")
 
+    def test_sync_all_with_thread_pool(self):
+        clock = FakeClock(datetime(2025, 5, 1, 9, 0, 0))
+        service = MembershipService()
+        for i in range(20):
+            service.add_member(Membership(f"{i:03d}", "Bronze", clock=clock))
+        self.assertEqual(len(service), 20)
+
+        billing = Mock()
+        billing.get_member_tier.return_value = "Silver"
+
+        service.sync_all(billing, max_workers=4)
+
+        self.assertEqual(billing.get_member_tier.call_count, 20)
+        self.assertEqual(service.get("007").tier, "Silver")
+        self.assertEqual(service.get("007").perks_available, 2)
+
+        with self.assertRaises(KeyError):
+            service.get("999")
+
+    def test_caching_billing_provider_reuses_tier_until_ttl(self):
+        billing = Mock()
+        billing.get_member_tier.return_value = "Gold"
+        now = [100.0]
+        cached = CachingBillingProvider(billing, ttl_s=30.0, maxsize=2, timer=lambda: now[0])
+
+        self.assertEqual(cached.get_member_tier("001"), "Gold")
+        self.assertEqual(cached.get_member_tier("001"), "Gold")
+        self.assertEqual(billing.get_member_tier.call_count, 1)
+
+        now[0] += 31.0  # expired
+        cached.get_member_tier("001")
+        self.assertEqual(billing.get_member_tier.call_count, 2)
+
+        cached.get_member_tier("002")
+        cached.get_member_tier("003")  # evicts least recently used "001"
+        cached.get_member_tier("001")
+        self.assertEqual(billing.get_member_tier.call_count, 5)
+
+    def test_sync_all_async_updates_every_member(self):
+        clock = FakeClock(datetime(2025, 5, 1, 9, 0, 0))
+        service = MembershipService()
+        for i in range(5):
+            service.add_member(Membership(f"{i:03d}", "Bronze", clock=clock))
+
+        billing = Mock()
+        billing.get_member_tier = AsyncMock(return_value="Gold")
+
+        asyncio.run(service.sync_all_async(billing, concurrency=2, batch_size=2))
+
+        self.assertEqual(billing.get_member_tier.await_count, 5)
+        self.assertEqual(service.get("004").perks_available, 4)
+
+        for bad in ({"concurrency": 0}, {"batch_size": 0}, {"batch_size": -1}):
+            with self.assertRaises(ValueError):
+                asyncio.run(service.sync_all_async(billing, **bad))
+
+    def test_mock_clock_drives_month_refresh(self):
+        clock = Mock()
+        clock.now.return_value = datetime(2025, 5, 1, 9, 0, 0)
+        member = Membership("004", "Bronze", clock=clock)
+        member.use_perk()
+        self.assertEqual(member.perks_available, 0)
+
+        clock.now.return_value = datetime(2025, 6, 1, 9, 0, 0)
+        member.use_perk()  # refresh to 1, then use it
+        self.assertEqual(member.perks_used, 1)
+
+    @unittest.skipIf(COMPILED, "class attributes of compiled modules can't be patched")
+    def test_patched_system_clock_now_drives_month_refresh(self):
+        with patch.object(SystemClock, "now", return_value=datetime(2025, 5, 1, 9, 0, 0)) as now:
+            member = Membership("005", "Bronze")
+            member.use_perk()
+
+            now.return_value = datetime(2025, 6, 1, 9, 0, 0)
+            member.use_perk()  # refresh to 1, then use it
+            self.assertEqual(member.perks_used, 1)
+
+    def test_patched_module_datetime_drives_month_refresh(self):
+        with patch.object(membership, "datetime") as fake_datetime:
+            fake_datetime.now.return_value = datetime(2025, 5, 1, 9, 0, 0)
+            member = Membership("006", "Bronze")
+            member.use_perk()
+
+            fake_datetime.now.return_value = datetime(2025, 6, 1, 9, 0, 0)
+            member.use_perk()  # refresh to 1, then use it
+            self.assertEqual(member.perks_used, 1)
+
 
 if __name__ == "__main__":
     unittest.main()